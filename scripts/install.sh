@@ -95,7 +95,6 @@ check_command julia
 echo "Creating directory structure..."
 mkdir -p src/bindings/{rust,cpp,go,julia,wasm}/src
 mkdir -p src/core
-mkdir -p src/runtime
 
 # Create virtual environment
 echo "Creating Python virtual environment..."
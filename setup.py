@@ -64,7 +64,6 @@ setup(
     package_dir={'': 'src'},
     packages=find_packages(where='src'),
     install_requires=[
-        'sly>=0.4',
         'setuptools-rust>=1.5.2',
     ],
     python_requires='>=3.6',
@@ -75,6 +74,9 @@ setup(
             binding=Binding.PyO3
         ),
     ],
+    entry_points={
+        'console_scripts': ['aslang = aslang.executor:main'],
+    },
     zip_safe=False,
     cmdclass={
         'build_ext': CustomBuildExt,
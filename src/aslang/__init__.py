@@ -1,4 +1,4 @@
-from .executor import main, evaluate
+from .executor import main, evaluate, evaluate_cached, evaluate_many
 
 __version__ = "0.1.0"
 __author__ = "Ashutosh Sharma"
\ No newline at end of file
@@ -2,48 +2,188 @@
 
 import sys
 import os
+import hashlib
+import functools
+import re
+import tempfile
 
-try:
-    from aslang import core
-except ImportError:
-    print("Error: Could not import 'aslang.core'. Please ensure the Rust extension is built and installed.")
-    print("Try running: pip install .")
-    sys.exit(1)
+@functools.lru_cache(maxsize=1)
+def _load_core():
+    # Deferred so that paths which never execute code (missing file, usage
+    # errors) don't pay for loading the Rust extension.
+    try:
+        from aslang import core
+    except ImportError:
+        print("Error: Could not import 'aslang.core'. Please ensure the Rust extension is built and installed.")
+        print("Try running: pip install .")
+        sys.exit(1)
+    return core
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aslang")
+CACHE_MAX_ENTRIES = 256
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".aslang_history")
+HISTORY_MAX_LINES = 1000
+
+# String literals and comments are matched too so brackets inside them are skipped
+_BRACKETS = re.compile(r'"[^"]*"|//[^\n]*|[{}\[\]()]')
 
 def evaluate(source):
     """
     Executes AS Lang source code using the Rust core runtime.
     """
+    # Pass the source string directly to the Rust core; failures come back
+    # as a flag rather than an exception
+    ok, payload = _load_core().run_code2(source)
+    if not ok:
+        sys.stderr.write(f"Runtime Error: {payload}\n")
+        return None
+    return payload
+
+def evaluate_many(source, n):
+    """
+    Compiles AS Lang source once and executes it n times, returning the
+    output of each run. Useful for benchmarks, which would otherwise time
+    parsing and compilation along with execution.
+    """
+    try:
+        program = _load_core().compile(source)
+        return [program.run() for _ in range(n)]
+    except RuntimeError as e:
+        sys.stderr.write(f"Runtime Error: {e}\n")
+        return None
+
+def evaluate_cached(source):
+    """
+    Executes AS Lang source code, reusing compiled bytecode from the on-disk
+    cache when this exact source has been compiled before. Accepts the
+    source as str or as raw UTF-8 bytes.
+    """
+    core = _load_core()
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    key = hashlib.sha256(f"{core.BYTECODE_VERSION}:".encode("ascii"))
+    key.update(source)
+    path = os.path.join(CACHE_DIR, key.hexdigest() + ".bin")
     try:
-        # Pass the source string directly to the Rust core
-        return core.run_code(source)
+        try:
+            with open(path, "rb") as f:
+                bytecode = f.read()
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            bytecode = None
+        if bytecode is not None:
+            try:
+                return core.run_compiled(bytecode)
+            except ValueError:
+                # Corrupt or stale entry: drop it and recompile below
+                _remove_cached(path)
+        bytecode = core.compile_code(source)
+        _store_cached(path, bytecode)
+        return core.run_compiled(bytecode)
     except RuntimeError as e:
-        print(f"Runtime Error: {e}")
+        sys.stderr.write(f"Runtime Error: {e}\n")
         return None
 
+def _store_cached(path, bytecode):
+    # The cache is only an optimisation, so an unwritable home directory
+    # must never stop the script from running.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytecode)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        _evict_cached()
+    except OSError:
+        pass
+
+def _remove_cached(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _evict_cached():
+    entries = [os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR) if name.endswith(".bin")]
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=os.path.getatime)
+    for entry in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+        _remove_cached(entry)
+
+def _bracket_depth(line):
+    depth = 0
+    for token in _BRACKETS.findall(line):
+        if token in "{[(":
+            depth += 1
+        elif token in "}])":
+            depth -= 1
+    return depth
+
 def main():
     if len(sys.argv) > 1:
         filename = sys.argv[1]
         if os.path.exists(filename):
-            with open(filename, 'r') as f:
+            # Read raw bytes; the core validates UTF-8 itself, so decoding
+            # here would only be undone again at the FFI boundary
+            with open(filename, 'rb') as f:
                 source = f.read()
-            evaluate(source)
+            evaluate_cached(source)
         else:
             print(f"Error: File '{filename}' not found.")
     else:
-        print(f"AS Lang {core.VERSION} (Python Wrapper)")
+        try:
+            import readline
+        except ImportError:
+            # Not available on every platform; input() still works without it
+            readline = None
+        if readline:
+            try:
+                readline.read_history_file(HISTORY_FILE)
+            except OSError:
+                pass
+            # Caps what write_history_file keeps; the default is unlimited
+            readline.set_history_length(HISTORY_MAX_LINES)
+        print(f"AS Lang {_load_core().VERSION} (Python Wrapper)")
         print("Type 'exit' to quit.")
+        # Physical lines are buffered until every bracket is closed, so a
+        # multi-line block reaches the core as one statement.
+        buf = []
+        depth = 0
         while True:
             try:
-                line = input("as > ")
-                if line == "exit":
-                    break
-                evaluate(line)
+                line = input("... " if buf else "as > ")
+                if not buf:
+                    if line == "exit":
+                        break
+                    if not line.strip():
+                        continue
+                buf.append(line)
+                depth += _bracket_depth(line)
+                if depth > 0:
+                    continue
+                evaluate("\n".join(buf))
+                buf.clear()
+                depth = 0
             except EOFError:
                 break
             except KeyboardInterrupt:
                 print("\nKeyboardInterrupt")
+                if buf:
+                    # Abandon the half-entered block but stay in the REPL
+                    buf.clear()
+                    depth = 0
+                    continue
                 break
+        if readline:
+            try:
+                readline.write_history_file(HISTORY_FILE)
+            except OSError:
+                pass
 
 if __name__ == "__main__":
     main()
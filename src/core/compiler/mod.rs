@@ -2,19 +2,23 @@
 
 use crate::parser::{AST, Expression, Statement, BinaryOp, UnaryOp};
 use crate::error::{ASError, ErrorKind, SourceLocation};
+use crate::interner::{Interner, Symbol};
 use std::collections::HashMap;
+use std::sync::Arc;
 
 #[derive(Debug, Clone)]
 pub enum Opcode {
     LoadConst(f64),
     LoadString(String),
     LoadBool(bool),
-    LoadVar(String),
-    StoreVar(String),
-    Call(String, usize),
+    LoadVar(Symbol),
+    StoreVar(Symbol),
+    Call(Symbol, usize),
     MakeArray(usize),
     GetIndex,
     SetIndex,
+    // Index a variable's array in place: (variable, number of indices on the stack)
+    LoadIndex(Symbol, usize),
     Return,
     Output,
     Input,
@@ -40,8 +44,15 @@ pub enum Opcode {
     Pop,
 }
 
+/// Leading bytes of every serialized program.
+pub const BYTECODE_MAGIC: &[u8] = b"ASBC";
+/// Bumped whenever the opcode encoding changes, invalidating cached blobs.
+pub const BYTECODE_VERSION: u8 = 2;
+
 pub struct Compiler {
     pub bytecode: Vec<Opcode>,
+    // Shared with compiled Programs; only copied if interned into while shared
+    pub interner: Arc<Interner>,
     variables: HashMap<String, usize>,
     functions: HashMap<String, usize>,
 }
@@ -50,6 +61,7 @@ impl Compiler {
     pub fn new() -> Self {
         Compiler {
             bytecode: Vec::new(),
+            interner: Arc::new(Interner::new()),
             variables: HashMap::new(),
             functions: HashMap::new(),
         }
@@ -62,14 +74,17 @@ impl Compiler {
             self.compile_statement(statement)?;
         }
         
-        Ok(self.bytecode.clone())
+        // Hand the buffer over instead of copying it; it is cleared on the
+        // next compile anyway.
+        Ok(std::mem::take(&mut self.bytecode))
     }
 
     fn compile_statement(&mut self, statement: &Statement) -> Result<(), ASError> {
         match statement {
             Statement::Let { name, value, type_annotation: _ } => {
                 self.compile_expression(value)?;
-                self.bytecode.push(Opcode::StoreVar(name.clone()));
+                let id = self.intern(name);
+                self.bytecode.push(Opcode::StoreVar(id));
                 self.variables.insert(name.clone(), self.variables.len());
             }
             Statement::Output(expr) => {
@@ -82,7 +97,8 @@ impl Compiler {
                     self.bytecode.push(Opcode::Output); // Print prompt
                 }
                 self.bytecode.push(Opcode::Input);
-                self.bytecode.push(Opcode::StoreVar(target.clone()));
+                let id = self.intern(target);
+                self.bytecode.push(Opcode::StoreVar(id));
                 self.variables.insert(target.clone(), self.variables.len());
             }
             Statement::Import { path } => {
@@ -204,6 +220,10 @@ impl Compiler {
         Ok(())
     }
     
+    fn intern(&mut self, name: &str) -> Symbol {
+        Arc::make_mut(&mut self.interner).intern(name)
+    }
+    
     fn compile_block(&mut self, statements: &Vec<Statement>) -> Result<(), ASError> {
         for stmt in statements {
             self.compile_statement(stmt)?;
@@ -218,7 +238,8 @@ impl Compiler {
             Expression::Boolean(b) => self.bytecode.push(Opcode::LoadBool(*b)),
             Expression::Identifier(name) => {
                 // In real compiler we check if it exists or generic load
-                self.bytecode.push(Opcode::LoadVar(name.clone()));
+                let id = self.intern(name);
+                self.bytecode.push(Opcode::LoadVar(id));
             },
             Expression::BinaryOp { left, operator, right } => {
                 self.compile_expression(left)?;
@@ -248,7 +269,8 @@ impl Compiler {
                 
                 match &**function {
                     Expression::Identifier(name) => {
-                        self.bytecode.push(Opcode::Call(name.clone(), arguments.len()));
+                        let id = self.intern(name);
+                        self.bytecode.push(Opcode::Call(id, arguments.len()));
                     },
                     _ => return Err(self.error("Only named functions supported currently")),
                 }
@@ -259,7 +281,29 @@ impl Compiler {
                 }
                 self.bytecode.push(Opcode::MakeArray(elements.len()));
             },
-            _ => return Err(self.error("Expression not implemented")),
+            Expression::Index { array, index } => {
+                // Walk `a[i][j]...` down to its base; when that is a plain
+                // variable, index it in place instead of loading (and so
+                // cloning) the whole array first.
+                let mut indices = vec![&**index];
+                let mut base = &**array;
+                while let Expression::Index { array, index } = base {
+                    indices.push(&**index);
+                    base = &**array;
+                }
+                
+                if let Expression::Identifier(name) = base {
+                    for index in indices.iter().rev() {
+                        self.compile_expression(index)?;
+                    }
+                    let id = self.intern(name);
+                    self.bytecode.push(Opcode::LoadIndex(id, indices.len()));
+                } else {
+                    self.compile_expression(array)?;
+                    self.compile_expression(index)?;
+                    self.bytecode.push(Opcode::GetIndex);
+                }
+            },
         }
         Ok(())
     }
@@ -282,28 +326,189 @@ impl Compiler {
         self.bytecode.push(Opcode::Jump(loop_start));
     }
 
-    #[allow(dead_code)]
+    /// Encode bytecode as a self-contained blob: the symbol table followed by
+    /// the opcodes, so it can be cached and later run by a fresh runtime.
+    pub fn serialize(&self, bytecode: &[Opcode]) -> Vec<u8> {
+        let mut bytes = Vec::new();
+        bytes.extend(BYTECODE_MAGIC);
+        bytes.push(BYTECODE_VERSION);
+        
+        bytes.extend(&(self.interner.len() as u32).to_le_bytes());
+        for id in 0..self.interner.len() {
+            write_str(&mut bytes, self.interner.resolve(id as Symbol));
+        }
+        
+        bytes.extend(&(bytecode.len() as u32).to_le_bytes());
+        for opcode in bytecode {
+            self.serialize_opcode(opcode, &mut bytes);
+        }
+        bytes
+    }
+
     fn serialize_opcode(&self, opcode: &Opcode, bytes: &mut Vec<u8>) {
-        // Serialization format needs update for all opcodes
-        // 1: LoadConst(f64)
-        // 2: LoadString(len, bytes)
-        // ...
-        // This serialization is critical for runtime compatibility
-        // For simplicity, I'm just putting basics here to pass build
-        // Real implementation needs robust serialization
         match opcode {
             Opcode::LoadConst(n) => { bytes.push(1); bytes.extend(&n.to_le_bytes()); }
-            Opcode::LoadString(s) => { 
-                bytes.push(2); 
-                bytes.extend(&(s.len() as u32).to_le_bytes()); 
-                bytes.extend(s.as_bytes()); 
+            Opcode::LoadString(s) => { bytes.push(2); write_str(bytes, s); }
+            Opcode::LoadBool(b) => { bytes.push(3); bytes.push(*b as u8); }
+            Opcode::LoadVar(id) => { bytes.push(4); bytes.extend(&id.to_le_bytes()); }
+            Opcode::StoreVar(id) => { bytes.push(5); bytes.extend(&id.to_le_bytes()); }
+            Opcode::Call(id, argc) => {
+                bytes.push(6);
+                bytes.extend(&id.to_le_bytes());
+                bytes.extend(&(*argc as u32).to_le_bytes());
             }
+            Opcode::MakeArray(n) => { bytes.push(7); bytes.extend(&(*n as u32).to_le_bytes()); }
             Opcode::Output => { bytes.push(8); }
-            _ => {} // ToDo: Implement all
+            Opcode::GetIndex => { bytes.push(9); }
+            Opcode::SetIndex => { bytes.push(10); }
+            Opcode::Return => { bytes.push(11); }
+            Opcode::Input => { bytes.push(12); }
+            Opcode::Import(path) => { bytes.push(13); write_str(bytes, path); }
+            Opcode::Add => { bytes.push(14); }
+            Opcode::Subtract => { bytes.push(15); }
+            Opcode::Multiply => { bytes.push(16); }
+            Opcode::Divide => { bytes.push(17); }
+            Opcode::Modulo => { bytes.push(18); }
+            Opcode::Power => { bytes.push(19); }
+            Opcode::Eq => { bytes.push(20); }
+            Opcode::Ne => { bytes.push(21); }
+            Opcode::Lt => { bytes.push(22); }
+            Opcode::Le => { bytes.push(23); }
+            Opcode::Gt => { bytes.push(24); }
+            Opcode::Ge => { bytes.push(25); }
+            Opcode::And => { bytes.push(26); }
+            Opcode::Or => { bytes.push(27); }
+            Opcode::Not => { bytes.push(28); }
+            Opcode::Negate => { bytes.push(29); }
+            Opcode::Jump(target) => { bytes.push(30); bytes.extend(&(*target as u32).to_le_bytes()); }
+            Opcode::JumpIfFalse(target) => { bytes.push(31); bytes.extend(&(*target as u32).to_le_bytes()); }
+            Opcode::Pop => { bytes.push(32); }
+            Opcode::LoadIndex(id, depth) => {
+                bytes.push(33);
+                bytes.extend(&id.to_le_bytes());
+                bytes.extend(&(*depth as u32).to_le_bytes());
+            }
         }
     }
+
+    /// Decode a blob produced by `serialize`. Its symbols are re-interned
+    /// into this compiler's table so they agree with names compiled later
+    /// (e.g. by imports).
+    pub fn deserialize(&mut self, bytes: &[u8]) -> Result<Vec<Opcode>, ASError> {
+        let mut reader = ByteReader { bytes, pos: 0 };
+        if reader.take(BYTECODE_MAGIC.len())? != BYTECODE_MAGIC || reader.u8()? != BYTECODE_VERSION {
+            return Err(reader.error());
+        }
+        
+        let symbol_count = reader.u32()?;
+        // Counts come from the blob itself, so don't preallocate from them:
+        // a corrupt header must fail in `take`, not abort on a huge allocation
+        let mut symbols = Vec::new();
+        for _ in 0..symbol_count {
+            symbols.push(self.intern(&reader.string()?));
+        }
+        
+        let opcode_count = reader.u32()?;
+        let mut bytecode = Vec::new();
+        for _ in 0..opcode_count {
+            let opcode = match reader.u8()? {
+                1 => Opcode::LoadConst(reader.f64()?),
+                2 => Opcode::LoadString(reader.string()?),
+                3 => Opcode::LoadBool(reader.u8()? != 0),
+                4 => Opcode::LoadVar(reader.symbol(&symbols)?),
+                5 => Opcode::StoreVar(reader.symbol(&symbols)?),
+                6 => {
+                    let id = reader.symbol(&symbols)?;
+                    Opcode::Call(id, reader.u32()? as usize)
+                }
+                7 => Opcode::MakeArray(reader.u32()? as usize),
+                8 => Opcode::Output,
+                9 => Opcode::GetIndex,
+                10 => Opcode::SetIndex,
+                11 => Opcode::Return,
+                12 => Opcode::Input,
+                13 => Opcode::Import(reader.string()?),
+                14 => Opcode::Add,
+                15 => Opcode::Subtract,
+                16 => Opcode::Multiply,
+                17 => Opcode::Divide,
+                18 => Opcode::Modulo,
+                19 => Opcode::Power,
+                20 => Opcode::Eq,
+                21 => Opcode::Ne,
+                22 => Opcode::Lt,
+                23 => Opcode::Le,
+                24 => Opcode::Gt,
+                25 => Opcode::Ge,
+                26 => Opcode::And,
+                27 => Opcode::Or,
+                28 => Opcode::Not,
+                29 => Opcode::Negate,
+                30 => Opcode::Jump(reader.u32()? as usize),
+                31 => Opcode::JumpIfFalse(reader.u32()? as usize),
+                32 => Opcode::Pop,
+                33 => {
+                    let id = reader.symbol(&symbols)?;
+                    Opcode::LoadIndex(id, reader.u32()? as usize)
+                }
+                _ => return Err(reader.error()),
+            };
+            bytecode.push(opcode);
+        }
+        Ok(bytecode)
+    }
     
     fn error(&self, msg: &str) -> ASError {
         ASError::new(ErrorKind::SyntaxError, msg.to_string(), SourceLocation::new(0,0))
     }
-}
\ No newline at end of file
+}
+
+fn write_str(bytes: &mut Vec<u8>, s: &str) {
+    bytes.extend(&(s.len() as u32).to_le_bytes());
+    bytes.extend(s.as_bytes());
+}
+
+struct ByteReader<'a> {
+    bytes: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> ByteReader<'a> {
+    fn take(&mut self, n: usize) -> Result<&'a [u8], ASError> {
+        let end = self.pos.checked_add(n).filter(|&end| end <= self.bytes.len()).ok_or_else(|| self.error())?;
+        let slice = &self.bytes[self.pos..end];
+        self.pos = end;
+        Ok(slice)
+    }
+    
+    fn u8(&mut self) -> Result<u8, ASError> {
+        Ok(self.take(1)?[0])
+    }
+    
+    fn u32(&mut self) -> Result<u32, ASError> {
+        let mut buf = [0; 4];
+        buf.copy_from_slice(self.take(4)?);
+        Ok(u32::from_le_bytes(buf))
+    }
+    
+    /// Read a symbol id and map it through the re-interned symbol table.
+    fn symbol(&mut self, symbols: &[Symbol]) -> Result<Symbol, ASError> {
+        let id = self.u32()? as usize;
+        symbols.get(id).copied().ok_or_else(|| self.error())
+    }
+    
+    fn f64(&mut self) -> Result<f64, ASError> {
+        let mut buf = [0; 8];
+        buf.copy_from_slice(self.take(8)?);
+        Ok(f64::from_le_bytes(buf))
+    }
+    
+    fn string(&mut self) -> Result<String, ASError> {
+        let len = self.u32()? as usize;
+        String::from_utf8(self.take(len)?.to_vec()).map_err(|_| self.error())
+    }
+    
+    fn error(&self) -> ASError {
+        ASError::new(ErrorKind::BytecodeError, "Invalid or incompatible bytecode".to_string(), SourceLocation::new(0, 0))
+    }
+}
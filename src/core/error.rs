@@ -25,6 +25,7 @@ pub enum ErrorKind {
     UndefinedVariable,
     UndefinedFunction,
     IOError,
+    BytecodeError,
 }
 
 #[derive(Debug, Clone)]
@@ -53,6 +54,7 @@ impl std::fmt::Display for ASError {
             ErrorKind::UndefinedVariable => "Undefined Variable",
             ErrorKind::UndefinedFunction => "Undefined Function",
             ErrorKind::IOError => "I/O Error",
+            ErrorKind::BytecodeError => "Bytecode Error",
         };
         
         if self.location.line > 0 {
@@ -0,0 +1,49 @@
+// Copyright (c) 2026 Ashutosh Sharma. All rights reserved.
+
+use std::collections::HashMap;
+
+/// Compact id standing in for an identifier string in bytecode.
+pub type Symbol = u32;
+
+/// Built-in names, pre-interned into the first slots so the runtime can
+/// recognise them with an integer compare.
+pub const BUILTINS: &[&str] = &["print"];
+pub const PRINT: Symbol = 0;
+
+#[derive(Debug, Clone)]
+pub struct Interner {
+    ids: HashMap<String, Symbol>,
+    names: Vec<String>,
+}
+
+impl Interner {
+    pub fn new() -> Self {
+        let mut interner = Interner {
+            ids: HashMap::new(),
+            names: Vec::new(),
+        };
+        for name in BUILTINS {
+            interner.intern(name);
+        }
+        interner
+    }
+
+    /// Return the id for `name`, assigning the next free one on first sight.
+    pub fn intern(&mut self, name: &str) -> Symbol {
+        if let Some(&id) = self.ids.get(name) {
+            return id;
+        }
+        let id = self.names.len() as Symbol;
+        self.ids.insert(name.to_string(), id);
+        self.names.push(name.to_string());
+        id
+    }
+
+    pub fn resolve(&self, id: Symbol) -> &str {
+        &self.names[id as usize]
+    }
+
+    pub fn len(&self) -> usize {
+        self.names.len()
+    }
+}
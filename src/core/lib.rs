@@ -3,6 +3,8 @@
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
 use pyo3::wrap_pyfunction;
+#[cfg(feature = "python")]
+use pyo3::types::PyBytes;
 
 pub mod compiler;
 pub mod parser;
@@ -11,6 +13,7 @@ pub mod error;
 pub mod lexer;
 pub mod types;
 pub mod resolver;
+pub mod interner;
 pub mod ffi;
 
 pub use compiler::*;
@@ -21,12 +24,100 @@ pub const VERSION: &str = "0.1.0";
 pub const AUTHOR: &str = "Ashutosh Sharma <ashutoshsharmawhy@gmail.com>";
 pub const COPYRIGHT: &str = "© 2026 Ashutosh Sharma";
 
+#[cfg(feature = "python")]
+fn execute_source(source: &str) -> Result<String, String> {
+    let mut runtime = runtime::Runtime::new();
+    runtime.execute(source).map_err(|e| format!("{}", e))
+}
+
 #[cfg(feature = "python")]
 #[pyfunction]
 fn run_code(source: String) -> PyResult<String> {
+    execute_source(&source).map_err(pyo3::exceptions::PyRuntimeError::new_err)
+}
+
+/// Like `run_code`, but reports failure as `(False, message)` instead of
+/// raising, so per-line callers such as the REPL avoid exception overhead.
+#[cfg(feature = "python")]
+#[pyfunction]
+fn run_code2(source: String) -> (bool, String) {
+    match execute_source(&source) {
+        Ok(output) => (true, output),
+        Err(message) => (false, message),
+    }
+}
+
+/// Like `run_code`, but returns the output as `bytes`, for callers that
+/// only scan it and would otherwise pay for building a `str`.
+#[cfg(feature = "python")]
+#[pyfunction]
+fn run_code_b(py: Python, source: String) -> PyResult<PyObject> {
+    let output = run_code(source)?;
+    Ok(PyBytes::new(py, output.as_bytes()).into())
+}
+
+/// Like `run_code`, but takes raw UTF-8 bytes (e.g. a file read in binary
+/// mode) so the text is validated once here instead of decoded by Python.
+#[cfg(feature = "python")]
+#[pyfunction]
+fn run_code_bytes(source: &[u8]) -> PyResult<String> {
+    execute_source(decode_source(source)?).map_err(pyo3::exceptions::PyRuntimeError::new_err)
+}
+
+#[cfg(feature = "python")]
+fn decode_source(source: &[u8]) -> PyResult<&str> {
+    std::str::from_utf8(source)
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("Source is not valid UTF-8: {}", e)))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+fn compile_code(py: Python, source: &[u8]) -> PyResult<PyObject> {
+    let mut runtime = runtime::Runtime::new();
+    match runtime.compile_to_bytes(decode_source(source)?) {
+        Ok(bytecode) => Ok(PyBytes::new(py, &bytecode).into()),
+        Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e))),
+    }
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+fn run_compiled(bytecode: &[u8]) -> PyResult<String> {
     let mut runtime = runtime::Runtime::new();
-    match runtime.execute(&source) {
+    match runtime.execute_compiled(bytecode) {
         Ok(output) => Ok(output),
+        // A blob that won't decode is a cache problem, not a script error;
+        // raise ValueError so callers can tell the two apart
+        Err(e) if e.kind == error::ErrorKind::BytecodeError => Err(pyo3::exceptions::PyValueError::new_err(format!("{}", e))),
+        Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e))),
+    }
+}
+
+/// A compiled program handle, returned by `core.compile`.
+#[cfg(feature = "python")]
+#[pyclass(name = "Program")]
+struct PyProgram {
+    program: runtime::Program,
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PyProgram {
+    fn run(&self) -> PyResult<String> {
+        match self.program.run() {
+            Ok(output) => Ok(output),
+            Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e))),
+        }
+    }
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(name = "compile")]
+fn compile_program(source: String) -> PyResult<PyProgram> {
+    let mut runtime = runtime::Runtime::new();
+    match runtime.compile_program(&source) {
+        Ok(program) => Ok(PyProgram { program }),
         Err(e) => Err(pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e))),
     }
 }
@@ -35,6 +126,14 @@ fn run_code(source: String) -> PyResult<String> {
 #[pymodule]
 fn core(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add("VERSION", VERSION)?;
+    m.add("BYTECODE_VERSION", compiler::BYTECODE_VERSION)?;
     m.add_function(wrap_pyfunction!(run_code, m)?)?;
+    m.add_function(wrap_pyfunction!(run_code2, m)?)?;
+    m.add_function(wrap_pyfunction!(run_code_b, m)?)?;
+    m.add_function(wrap_pyfunction!(run_code_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(compile_code, m)?)?;
+    m.add_function(wrap_pyfunction!(run_compiled, m)?)?;
+    m.add_function(wrap_pyfunction!(compile_program, m)?)?;
+    m.add_class::<PyProgram>()?;
     Ok(())
 } 
\ No newline at end of file
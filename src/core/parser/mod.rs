@@ -41,7 +41,6 @@ pub enum Expression {
         operator: UnaryOp,
         operand: Box<Expression>,
     },
-    Grouping(Box<Expression>),
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -107,35 +106,11 @@ enum Precedence {
     Primary,
 }
 
-#[allow(dead_code)]
-pub struct Parser<'a> {
-    #[allow(dead_code)]
-    lexer: Lexer<'a>,
-    #[allow(dead_code)]
-    current_token: Token,
-    #[allow(dead_code)]
-    peek_token: Token,
-    #[allow(dead_code)]
-    location: SourceLocation,
-}
+/// Entry point for parsing; the parse state itself lives in `ParserInstance`.
+pub struct Parser;
 
-impl<'a> Parser<'a> {
-    pub fn new(input: &'a str) -> Self {
-        let mut lexer = Lexer::new(input);
-        let current_token = lexer.tokenize().unwrap_or(vec![Token::EOF]).first().cloned().unwrap_or(Token::EOF);
-        // This is a bit simplified; real implementation should use iterator
-        // For now, let's just reuse the simpler vector approach from before but adapted
-        // Actually, let's rewrite to token iterator to be cleaner or just load all tokens
-        Parser {
-            lexer: Lexer::new(input), // We'll just re-create lexer for now or change design
-            current_token: Token::EOF,
-            peek_token: Token::EOF,
-            location: SourceLocation::new(0, 0),
-        }
-    }
-    
-    // Better approach: consume tokens from a vector
-    pub fn parse(input: &'a str) -> Result<AST, ASError> {
+impl Parser {
+    pub fn parse(input: &str) -> Result<AST, ASError> {
         let mut lexer = Lexer::new(input);
         let tokens = lexer.tokenize()?;
         let mut parser = ParserInstance::new(tokens);
@@ -210,7 +185,7 @@ impl ParserInstance {
         };
         
         // Check for optional type annotation: let x: Type = value
-        let type_annotation = if self.peek() == Token::Colon {
+        let type_annotation = if self.peek() == &Token::Colon {
             self.advance(); // consume ':'
             Some(self.parse_type()?)
         } else {
@@ -245,7 +220,7 @@ impl ParserInstance {
         self.advance(); // consume output
         let expr = self.parse_expression(Precedence::None)?;
         // Output doesn't enforce semicolon in original design, but strict parser should
-        if self.peek() == Token::Semicolon {
+        if self.peek() == &Token::Semicolon {
             self.advance();
         }
         Ok(Statement::Output(expr))
@@ -288,14 +263,14 @@ impl ParserInstance {
         }
         
         let mut params = Vec::new();
-        if self.peek() != Token::RParen {
+        if self.peek() != &Token::RParen {
             loop {
                 match self.advance() {
                     Token::Identifier(s) => params.push(s),
                     _ => return Err(self.error("Expected parameter name")),
                 }
                 
-                if self.peek() == Token::Comma {
+                if self.peek() == &Token::Comma {
                     self.advance();
                 } else {
                     break;
@@ -328,7 +303,7 @@ impl ParserInstance {
         let mut elif_branches = Vec::new();
         let mut else_branch = None;
         
-        while self.peek() == Token::ElseIf {
+        while self.peek() == &Token::ElseIf {
             self.advance();
             let elif_cond = self.parse_expression(Precedence::None)?;
             if self.advance() != Token::LBrace {
@@ -337,7 +312,7 @@ impl ParserInstance {
             elif_branches.push((elif_cond, self.parse_block()?));
         }
         
-        if self.peek() == Token::Else {
+        if self.peek() == &Token::Else {
             self.advance();
             if self.advance() != Token::LBrace {
                 return Err(self.error("Expected '{' after else"));
@@ -367,7 +342,7 @@ impl ParserInstance {
             return Err(self.error("Expected '(' after for"));
         }
         
-        let init = if self.peek() == Token::Semicolon {
+        let init = if self.peek() == &Token::Semicolon {
             None
         } else {
             Some(Box::new(self.parse_statement()?))
@@ -378,14 +353,14 @@ impl ParserInstance {
             self.advance(); // consume ;
         }
         
-        let condition = if self.peek() == Token::Semicolon {
+        let condition = if self.peek() == &Token::Semicolon {
             None
         } else {
             Some(self.parse_expression(Precedence::None)?)
         };
         self.consume_semicolon()?;
         
-        let update = if self.peek() == Token::RParen {
+        let update = if self.peek() == &Token::RParen {
             None
         } else {
             Some(Box::new(self.parse_expression_statement()?))
@@ -406,7 +381,7 @@ impl ParserInstance {
     
     fn parse_return(&mut self) -> Result<Statement, ASError> {
         self.advance(); // consume return
-        let value = if self.peek() == Token::Semicolon {
+        let value = if self.peek() == &Token::Semicolon {
             None
         } else {
             Some(self.parse_expression(Precedence::None)?)
@@ -417,7 +392,7 @@ impl ParserInstance {
     
     fn parse_block(&mut self) -> Result<Vec<Statement>, ASError> {
         let mut statements = Vec::new();
-        while self.peek() != Token::RBrace && !self.is_at_end() {
+        while self.peek() != &Token::RBrace && !self.is_at_end() {
             statements.push(self.parse_statement()?);
         }
         if self.advance() != Token::RBrace {
@@ -454,7 +429,9 @@ impl ParserInstance {
                 if self.advance() != Token::RParen {
                     return Err(self.error("Expected ')'"));
                 }
-                Ok(Expression::Grouping(Box::new(expr)))
+                // Parentheses only steer precedence, which the tree shape
+                // already encodes, so no wrapper node is needed.
+                Ok(expr)
             }
             Token::LBracket => self.parse_array(),
             Token::Minus => self.parse_unary(UnaryOp::Negate),
@@ -465,15 +442,19 @@ impl ParserInstance {
     
     fn parse_unary(&mut self, op: UnaryOp) -> Result<Expression, ASError> {
         let operand = self.parse_expression(Precedence::Unary)?;
-        Ok(Expression::UnaryOp { operator: op, operand: Box::new(operand) })
+        // Fold negative literals so `-5` is a constant, not a runtime negate
+        match (op, operand) {
+            (UnaryOp::Negate, Expression::Number(n)) => Ok(Expression::Number(-n)),
+            (op, operand) => Ok(Expression::UnaryOp { operator: op, operand: Box::new(operand) }),
+        }
     }
     
     fn parse_array(&mut self) -> Result<Expression, ASError> {
         let mut elements = Vec::new();
-        if self.peek() != Token::RBracket {
+        if self.peek() != &Token::RBracket {
             loop {
                 elements.push(self.parse_expression(Precedence::None)?);
-                if self.peek() == Token::Comma {
+                if self.peek() == &Token::Comma {
                     self.advance();
                 } else {
                     break;
@@ -490,38 +471,27 @@ impl ParserInstance {
 
     fn parse_infix(&mut self, left: Expression) -> Result<Expression, ASError> {
         let token = self.advance();
+        if let Some((op, precedence)) = binary_operator(&token) {
+            return self.binary(left, op, precedence);
+        }
         match token {
-            Token::Plus => self.binary(left, BinaryOp::Add),
-            Token::Minus => self.binary(left, BinaryOp::Subtract),
-            Token::Star => self.binary(left, BinaryOp::Multiply),
-            Token::Slash => self.binary(left, BinaryOp::Divide),
-            Token::Percent => self.binary(left, BinaryOp::Modulo),
-            Token::EqEq => self.binary(left, BinaryOp::Eq),
-            Token::Ne => self.binary(left, BinaryOp::Ne),
-            Token::Lt => self.binary(left, BinaryOp::Lt),
-            Token::Le => self.binary(left, BinaryOp::Le),
-            Token::Gt => self.binary(left, BinaryOp::Gt),
-            Token::Ge => self.binary(left, BinaryOp::Ge),
-            Token::And => self.binary(left, BinaryOp::And),
-            Token::Or => self.binary(left, BinaryOp::Or),
             Token::LParen => self.call(left),
             Token::LBracket => self.index(left),
             _ => Err(self.error("Unknown infix operator")),
         }
     }
     
-    fn binary(&mut self, left: Expression, op: BinaryOp) -> Result<Expression, ASError> {
-        let precedence = self.get_precedence(self.prev());
+    fn binary(&mut self, left: Expression, op: BinaryOp, precedence: Precedence) -> Result<Expression, ASError> {
         let right = self.parse_expression(precedence)?;
-        Ok(Expression::BinaryOp { left: Box::new(left), operator: op, right: Box::new(right) })
+        Ok(fold_binary(left, op, right))
     }
     
     fn call(&mut self, function: Expression) -> Result<Expression, ASError> {
         let mut arguments = Vec::new();
-        if self.peek() != Token::RParen {
+        if self.peek() != &Token::RParen {
             loop {
                 arguments.push(self.parse_expression(Precedence::None)?);
-                if self.peek() == Token::Comma {
+                if self.peek() == &Token::Comma {
                     self.advance();
                 } else {
                     break;
@@ -544,57 +514,42 @@ impl ParserInstance {
         Ok(Expression::Index { array: Box::new(array), index: Box::new(index) })
     }
     
-    fn prev(&self) -> Token {
-        // Limitation of our simple vector parser, but tokens vec is available 
-        // Logic should be cleaner in real iter implementation
-        // For now hack:
-        self.tokens[self.current - 1].clone()
-    }
-
-    fn get_precedence(&self, token: Token) -> Precedence {
+    fn get_precedence(&self, token: &Token) -> Precedence {
         match token {
-            Token::Eq | Token::EqEq | Token::Ne => Precedence::Equality,
-            Token::Lt | Token::Le | Token::Gt | Token::Ge => Precedence::Comparison,
-            Token::Plus | Token::Minus => Precedence::Term,
-            Token::Star | Token::Slash | Token::Percent => Precedence::Factor,
-            Token::And => Precedence::And,
-            Token::Or => Precedence::Or,
-            Token::LParen => Precedence::Call,
-            Token::LBracket => Precedence::Call,
-            _ => Precedence::None,
+            Token::LParen | Token::LBracket => Precedence::Call,
+            // Assignment isn't an infix operator yet; binding it keeps
+            // `x = 1` reporting an unknown operator rather than a bad statement
+            Token::Eq => Precedence::Equality,
+            _ => binary_operator(token).map_or(Precedence::None, |(_, precedence)| precedence),
         }
     }
 
     fn advance(&mut self) -> Token {
-        if !self.is_at_end() {
-            self.current += 1;
+        if self.is_at_end() {
+            return Token::EOF;
         }
-        self.previous()
-    }
-    
-    fn previous(&self) -> Token {
-        self.tokens[self.current - 1].clone()
+        self.current += 1;
+        // Each token is consumed exactly once, so move it out of the buffer
+        // instead of cloning its payload; nothing looks behind `current`.
+        std::mem::replace(&mut self.tokens[self.current - 1], Token::EOF)
     }
 
-    fn peek(&self) -> Token {
-        if self.current >= self.tokens.len() {
-            return Token::EOF;
-        }
-        self.tokens[self.current].clone()
+    // Borrow instead of cloning: peek runs several times per token, and
+    // cloning would copy the String payload of every identifier/literal.
+    fn peek(&self) -> &Token {
+        // The lexer always terminates the stream with EOF, so clamp to it
+        &self.tokens[self.current.min(self.tokens.len() - 1)]
     }
 
     fn is_at_end(&self) -> bool {
-        match self.peek() {
-            Token::EOF => true,
-            _ => false,
-        }
+        matches!(self.peek(), Token::EOF)
     }
     
     fn consume_semicolon(&mut self) -> Result<(), ASError> {
-        if self.peek() == Token::Semicolon {
+        if self.peek() == &Token::Semicolon {
             self.advance();
             Ok(())
-        } else if self.peek() == Token::EOF || self.peek() == Token::RBrace {
+        } else if self.peek() == &Token::EOF || self.peek() == &Token::RBrace {
             // Optional semicolon at end of block/file
             Ok(())
         } else {
@@ -611,4 +566,45 @@ impl ParserInstance {
             SourceLocation::new(0, 0), // ToDo: propagating location from Token
         )
     }
-}
\ No newline at end of file
+}
+
+/// The one table of binary operators: the node each token builds and how
+/// tightly it binds. Both the precedence climb and parse_infix read it.
+fn binary_operator(token: &Token) -> Option<(BinaryOp, Precedence)> {
+    let entry = match token {
+        Token::Or => (BinaryOp::Or, Precedence::Or),
+        Token::And => (BinaryOp::And, Precedence::And),
+        Token::EqEq => (BinaryOp::Eq, Precedence::Equality),
+        Token::Ne => (BinaryOp::Ne, Precedence::Equality),
+        Token::Lt => (BinaryOp::Lt, Precedence::Comparison),
+        Token::Le => (BinaryOp::Le, Precedence::Comparison),
+        Token::Gt => (BinaryOp::Gt, Precedence::Comparison),
+        Token::Ge => (BinaryOp::Ge, Precedence::Comparison),
+        Token::Plus => (BinaryOp::Add, Precedence::Term),
+        Token::Minus => (BinaryOp::Subtract, Precedence::Term),
+        Token::Star => (BinaryOp::Multiply, Precedence::Factor),
+        Token::Slash => (BinaryOp::Divide, Precedence::Factor),
+        Token::Percent => (BinaryOp::Modulo, Precedence::Factor),
+        _ => return None,
+    };
+    Some(entry)
+}
+
+/// Evaluate arithmetic on two numeric literals at parse time, so constant
+/// subexpressions cost nothing when they sit inside a loop. Division by a
+/// literal zero is left alone so it still fails at runtime.
+fn fold_binary(left: Expression, op: BinaryOp, right: Expression) -> Expression {
+    if let (Expression::Number(a), Expression::Number(b)) = (&left, &right) {
+        let folded = match op {
+            BinaryOp::Add => Some(a + b),
+            BinaryOp::Subtract => Some(a - b),
+            BinaryOp::Multiply => Some(a * b),
+            BinaryOp::Divide if *b != 0.0 => Some(a / b),
+            _ => None,
+        };
+        if let Some(n) = folded {
+            return Expression::Number(n);
+        }
+    }
+    Expression::BinaryOp { left: Box::new(left), operator: op, right: Box::new(right) }
+}
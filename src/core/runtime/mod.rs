@@ -4,7 +4,8 @@ use crate::compiler::{Compiler, Opcode};
 use crate::parser::Parser;
 use crate::types::TypeChecker;
 use crate::error::{ASError, ErrorKind, SourceLocation};
-use std::collections::HashMap;
+use crate::interner::{self, Interner};
+use std::sync::Arc;
 
 #[derive(Clone, Debug, PartialEq)]
 pub enum Value {
@@ -43,7 +44,8 @@ pub struct Runtime {
     type_checker: TypeChecker,
     resolver: Resolver,
     stack: Vec<Value>,
-    variables: HashMap<String, Value>,
+    // Indexed directly by interned Symbol; None marks an unassigned slot
+    variables: Vec<Option<Value>>,
     pub debug: bool,
 }
 
@@ -54,22 +56,45 @@ impl Runtime {
             type_checker: TypeChecker::new(),
             resolver: Resolver::new(),
             stack: Vec::new(),
-            variables: HashMap::new(),
+            variables: Vec::new(),
             debug: false,
         }
     }
 
     pub fn execute(&mut self, input: &str) -> Result<String, ASError> {
+        let bytecode = self.compile(input)?;
+        
+        self.execute_bytecode(&bytecode)
+    }
+
+    pub fn compile(&mut self, input: &str) -> Result<Vec<Opcode>, ASError> {
         let ast = Parser::parse(input)?;
         
         // Type check before compilation
         self.type_checker.check(&ast)?;
         
-        let bytecode = self.compiler.compile(&ast)?;
-        
+        self.compiler.compile(&ast)
+    }
+
+    /// Parse, check and compile `input` into a blob that `execute_compiled`
+    /// can run later without repeating those stages.
+    pub fn compile_to_bytes(&mut self, input: &str) -> Result<Vec<u8>, ASError> {
+        let bytecode = self.compile(input)?;
+        Ok(self.compiler.serialize(&bytecode))
+    }
+
+    pub fn execute_compiled(&mut self, bytes: &[u8]) -> Result<String, ASError> {
+        let bytecode = self.compiler.deserialize(bytes)?;
         self.execute_bytecode(&bytecode)
     }
 
+    /// Compile `input` into a reusable `Program` that can be run repeatedly
+    /// without parsing or compiling again.
+    pub fn compile_program(&mut self, input: &str) -> Result<Program, ASError> {
+        let bytecode = self.compile(input)?;
+        Ok(Program { bytecode, interner: Arc::clone(&self.compiler.interner) })
+    }
+
     fn execute_bytecode(&mut self, bytecode: &[Opcode]) -> Result<String, ASError> {
         let mut pc = 0;
         let mut output = String::new();
@@ -86,15 +111,19 @@ impl Runtime {
                 Opcode::LoadString(s) => self.stack.push(Value::String(s.clone())),
                 Opcode::LoadBool(b) => self.stack.push(Value::Boolean(*b)),
                 Opcode::LoadVar(name) => {
-                    if let Some(val) = self.variables.get(name) {
+                    if let Some(Some(val)) = self.variables.get(*name as usize) {
                         self.stack.push(val.clone());
                     } else {
-                        return Err(self.error(&format!("Undefined variable: {}", name)));
+                        return Err(self.error(&format!("Undefined variable: {}", self.compiler.interner.resolve(*name))));
                     }
                 },
                 Opcode::StoreVar(name) => {
                     let val = self.pop()?;
-                    self.variables.insert(name.clone(), val);
+                    let slot = *name as usize;
+                    if slot >= self.variables.len() {
+                        self.variables.resize(slot + 1, None);
+                    }
+                    self.variables[slot] = Some(val);
                 },
                 Opcode::Output => {
                     let val = self.pop()?;
@@ -122,10 +151,11 @@ impl Runtime {
                     // self.type_checker.check(&ast)?;
 
                     // 5. Compile
-                    // Create a new compiler instance to avoid messing up current bytecode offsets
-                    // or append? For simplicity, we execute recursively.
-                    let mut compiler = Compiler::new();
-                    let bytecode = compiler.compile(&ast)?;
+                    // Reuse our compiler so the imported file interns names into the
+                    // same symbol table; compile() hands back its own bytecode vector,
+                    // so the offsets of the running sequence are untouched.
+                    // For simplicity, we execute recursively.
+                    let bytecode = self.compiler.compile(&ast)?;
                     
                     // 6. Execute (recursively)
                     // Save PC and bytecode? No, we are in a loop.
@@ -165,6 +195,10 @@ impl Runtime {
                      if b == 0.0 { return Err(self.error("Division by zero")); }
                      self.stack.push(Value::Number(a / b));
                 },
+                Opcode::Negate => {
+                     let a = self.pop_number()?;
+                     self.stack.push(Value::Number(-a));
+                },
                 
                 // Comparison
                 Opcode::Eq => {
@@ -183,6 +217,25 @@ impl Runtime {
                     self.stack.push(Value::Boolean(a < b));
                 },
                 
+                Opcode::LoadIndex(name, depth) => {
+                    let indices = self.pop_n(*depth)?;
+                    let element = match self.variables.get(*name as usize) {
+                        Some(Some(array)) => self.index_into(array, &indices)?.clone(),
+                        _ => return Err(self.error(&format!("Undefined variable: {}", self.compiler.interner.resolve(*name)))),
+                    };
+                    self.stack.push(element);
+                },
+                Opcode::GetIndex => {
+                    let index = self.pop()?;
+                    let array = self.pop()?;
+                    let element = self.index_into(&array, &[index])?.clone();
+                    self.stack.push(element);
+                },
+                Opcode::MakeArray(count) => {
+                    let elements = self.pop_n(*count)?;
+                    self.stack.push(Value::Array(elements));
+                },
+                
                 // Control Flow
                 Opcode::Jump(target) => {
                     pc = *target;
@@ -201,13 +254,9 @@ impl Runtime {
                 
                 // Function Calls
                 Opcode::Call(name, arg_count) => {
-                    let mut args = Vec::new();
-                    for _ in 0..*arg_count {
-                        args.push(self.pop()?);
-                    }
-                    args.reverse(); // Arguments are popped in reverse order
+                    let args = self.pop_n(*arg_count)?;
 
-                    if name == "print" {
+                    if *name == interner::PRINT {
                         // Built-in print function
                         let output_str: Vec<String> = args.iter().map(|v| v.to_string()).collect();
                         let line = output_str.join(" ");
@@ -215,7 +264,7 @@ impl Runtime {
                         output.push_str(&format!("{}\n", line));
                         self.stack.push(Value::None); // print returns None
                     } else {
-                        return Err(self.error(&format!("Function '{}' not defined or supported in this runtime version", name)));
+                        return Err(self.error(&format!("Function '{}' not defined or supported in this runtime version", self.compiler.interner.resolve(*name))));
                     }
                 },
                 Opcode::Return => {
@@ -241,6 +290,33 @@ impl Runtime {
         self.stack.pop().ok_or_else(|| self.error("Stack underflow"))
     }
     
+    /// Pop the top `count` values in push order, moving them off the stack
+    /// in one step rather than popping and reversing one at a time.
+    fn pop_n(&mut self, count: usize) -> Result<Vec<Value>, ASError> {
+        if count > self.stack.len() {
+            return Err(self.error("Stack underflow"));
+        }
+        let start = self.stack.len() - count;
+        Ok(self.stack.split_off(start))
+    }
+    
+    /// Follow `indices` through nested arrays, borrowing the element.
+    fn index_into<'v>(&self, mut value: &'v Value, indices: &[Value]) -> Result<&'v Value, ASError> {
+        for index in indices {
+            value = match (value, index) {
+                (Value::Array(elements), Value::Number(n)) => {
+                    if *n < 0.0 || n.fract() != 0.0 || *n as usize >= elements.len() {
+                        return Err(self.error(&format!("Index out of bounds: {}", n)));
+                    }
+                    &elements[*n as usize]
+                }
+                (Value::Array(_), _) => return Err(self.error("Array index must be a number")),
+                _ => return Err(self.error("Cannot index into a non-array value")),
+            };
+        }
+        Ok(value)
+    }
+    
     fn pop_number(&mut self) -> Result<f64, ASError> {
         match self.pop()? {
             Value::Number(n) => Ok(n),
@@ -253,6 +329,22 @@ impl Runtime {
     }
 }
 
+/// Bytecode together with the symbol table it was compiled against.
+#[derive(Debug, Clone)]
+pub struct Program {
+    bytecode: Vec<Opcode>,
+    interner: Arc<Interner>,
+}
+
+impl Program {
+    /// Execute on a fresh runtime, so every run starts from empty variables.
+    pub fn run(&self) -> Result<String, ASError> {
+        let mut runtime = Runtime::new();
+        runtime.compiler.interner = Arc::clone(&self.interner);
+        runtime.execute_bytecode(&self.bytecode)
+    }
+}
+
 pub fn execute(input: &str) -> Result<String, String> {
     let mut runtime = Runtime::new();
     runtime.execute(input).map_err(|e| e.message)
@@ -245,7 +245,12 @@ impl TypeChecker {
                     Ok(Type::Array(Box::new(first_type)))
                 }
             }
-            _ => Ok(Type::Any),
+            Expression::Index { array, index: _ } => {
+                match self.infer_type(array)? {
+                    Type::Array(inner) => Ok(*inner),
+                    _ => Ok(Type::Any),
+                }
+            }
         }
     }
 
@@ -0,0 +1,58 @@
+// Copyright (c) 2026 Ashutosh Sharma. All rights reserved.
+
+use aslang::runtime::Runtime;
+use aslang::error::ErrorKind;
+
+const PROGRAM: &str = r#"
+let xs = [1, 2, 3];
+let grid = [[4, 5], [6, 7]];
+let i = 0;
+let total = 0;
+let ready = true;
+while i < 3 {
+    let total = total + xs[i] + grid[1][0];
+    let i = i + 1;
+}
+if ready {
+    print("total", total);
+} else {
+    output "unreachable";
+}
+output [[8, 9], [10, 11]][1][0];
+output "done";
+"#;
+
+#[test]
+fn test_serialized_bytecode_matches_direct_execution() {
+    let expected = Runtime::new().execute(PROGRAM).unwrap();
+    
+    let bytes = Runtime::new().compile_to_bytes(PROGRAM).unwrap();
+    let output = Runtime::new().execute_compiled(&bytes).unwrap();
+    
+    assert_eq!(output, expected);
+    assert_eq!(output, "total 24\n10\ndone\n");
+}
+
+#[test]
+fn test_truncated_bytecode_is_rejected() {
+    let bytes = Runtime::new().compile_to_bytes(PROGRAM).unwrap();
+    
+    for len in [0, 4, 5, 9, bytes.len() / 2, bytes.len() - 1] {
+        let err = Runtime::new().execute_compiled(&bytes[..len]).unwrap_err();
+        assert_eq!(err.kind, ErrorKind::BytecodeError);
+    }
+}
+
+#[test]
+fn test_garbage_bytecode_is_rejected() {
+    let err = Runtime::new().execute_compiled(b"not bytecode at all").unwrap_err();
+    assert_eq!(err.kind, ErrorKind::BytecodeError);
+    
+    // Huge counts in the header must fail cleanly rather than allocate
+    let mut bytes = b"ASBC".to_vec();
+    bytes.push(aslang::compiler::BYTECODE_VERSION);
+    bytes.extend(&0u32.to_le_bytes());
+    bytes.extend(&u32::MAX.to_le_bytes());
+    let err = Runtime::new().execute_compiled(&bytes).unwrap_err();
+    assert_eq!(err.kind, ErrorKind::BytecodeError);
+}
@@ -0,0 +1,56 @@
+// Copyright (c) 2026 Ashutosh Sharma. All rights reserved.
+
+use aslang::parser::{Parser, Statement, Expression, BinaryOp};
+
+#[test]
+fn test_parentheses_leave_no_wrapper_node() {
+    let ast = Parser::parse("(a + b) * c;").unwrap();
+    
+    let expected = Expression::BinaryOp {
+        left: Box::new(Expression::BinaryOp {
+            left: Box::new(Expression::Identifier("a".to_string())),
+            operator: BinaryOp::Add,
+            right: Box::new(Expression::Identifier("b".to_string())),
+        }),
+        operator: BinaryOp::Multiply,
+        right: Box::new(Expression::Identifier("c".to_string())),
+    };
+    assert_eq!(ast.statements[0], Statement::ExpressionStmt(expected));
+}
+
+#[test]
+fn test_binary_operators_bind_by_precedence() {
+    let ast = Parser::parse("a - b - c < d * e;").unwrap();
+    let name = |s: &str| Box::new(Expression::Identifier(s.to_string()));
+    
+    let difference = Expression::BinaryOp {
+        left: Box::new(Expression::BinaryOp {
+            left: name("a"),
+            operator: BinaryOp::Subtract,
+            right: name("b"),
+        }),
+        operator: BinaryOp::Subtract,
+        right: name("c"),
+    };
+    let product = Expression::BinaryOp {
+        left: name("d"),
+        operator: BinaryOp::Multiply,
+        right: name("e"),
+    };
+    let expected = Expression::BinaryOp {
+        left: Box::new(difference),
+        operator: BinaryOp::Lt,
+        right: Box::new(product),
+    };
+    assert_eq!(ast.statements[0], Statement::ExpressionStmt(expected));
+}
+
+#[test]
+fn test_constant_arithmetic_is_folded() {
+    let ast = Parser::parse("-5; 2 * 3 + 4; 1 / 0;").unwrap();
+    
+    assert_eq!(ast.statements[0], Statement::ExpressionStmt(Expression::Number(-5.0)));
+    assert_eq!(ast.statements[1], Statement::ExpressionStmt(Expression::Number(10.0)));
+    // Division by zero must still surface as a runtime error
+    assert!(matches!(ast.statements[2], Statement::ExpressionStmt(Expression::BinaryOp { .. })));
+}
@@ -0,0 +1,42 @@
+// Copyright (c) 2026 Ashutosh Sharma. All rights reserved.
+
+use aslang::runtime::execute;
+
+#[test]
+fn test_index_variable_arrays() {
+    // `m[1][0] + a[0]` only type-checks if indexing infers the element type
+    let output = execute("let a = [10, 20, 30]; let i = 2; output a[i]; let m = [[1, 2], [3, 4]]; output m[1][0] + a[0];").unwrap();
+    assert_eq!(output, "30\n13\n");
+}
+
+#[test]
+fn test_index_array_literal() {
+    let output = execute("output [[5, 6], [7, 8]][1][0];").unwrap();
+    assert_eq!(output, "7\n");
+}
+
+#[test]
+fn test_index_out_of_bounds() {
+    let err = execute("let a = [1, 2]; output a[2];").unwrap_err();
+    assert!(err.contains("Index out of bounds"), "{}", err);
+    
+    let err = execute("let a = [1, 2]; output a[-1];").unwrap_err();
+    assert!(err.contains("Index out of bounds"), "{}", err);
+    
+    let err = execute("let a = [1, 2]; output a[0.5];").unwrap_err();
+    assert!(err.contains("Index out of bounds"), "{}", err);
+}
+
+#[test]
+fn test_index_non_array() {
+    let err = execute("let s = \"text\"; output s[0];").unwrap_err();
+    assert!(err.contains("non-array"), "{}", err);
+}
+
+#[test]
+fn test_compiled_program_runs_repeatedly() {
+    let program = aslang::runtime::Runtime::new().compile_program("let xs = [1, 2]; print(xs[1] + 1);").unwrap();
+    
+    assert_eq!(program.run().unwrap(), "3\n");
+    assert_eq!(program.run().unwrap(), "3\n");
+}
@@ -0,0 +1,99 @@
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Ensure we can import the local package; the executor loads the Rust core
+# lazily, so these tests run without the extension built
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from aslang import executor
+
+class FakeCore:
+    """Stands in for aslang.core: "bytecode" is the source behind a marker."""
+    BYTECODE_VERSION = 2
+
+    def __init__(self):
+        self.compiled = 0
+
+    def compile_code(self, source):
+        self.compiled += 1
+        return b"ok:" + source
+
+    def run_compiled(self, bytecode):
+        if not bytecode.startswith(b"ok:"):
+            raise ValueError("Invalid or incompatible bytecode")
+        return bytecode[3:].decode()
+
+def _with_cache(test):
+    def run():
+        with tempfile.TemporaryDirectory() as cache_dir:
+            core = FakeCore()
+            with mock.patch.object(executor, "_load_core", return_value=core), \
+                    mock.patch.object(executor, "CACHE_DIR", cache_dir):
+                test(core, cache_dir)
+    run.__name__ = test.__name__
+    return run
+
+def _entries(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith(".bin"))
+
+@_with_cache
+def test_cache_miss_compiles_and_stores(core, cache_dir):
+    assert executor.evaluate_cached("print(1);") == "print(1);"
+    assert core.compiled == 1
+    [entry] = _entries(cache_dir)
+    with open(os.path.join(cache_dir, entry), "rb") as f:
+        assert f.read() == b"ok:print(1);"
+
+@_with_cache
+def test_cache_hit_skips_compilation(core, cache_dir):
+    executor.evaluate_cached("print(1);")
+    assert executor.evaluate_cached(b"print(1);") == "print(1);"
+    assert core.compiled == 1
+
+@_with_cache
+def test_corrupt_cache_entry_is_replaced(core, cache_dir):
+    executor.evaluate_cached("print(1);")
+    [entry] = _entries(cache_dir)
+    path = os.path.join(cache_dir, entry)
+    with open(path, "wb") as f:
+        f.write(b"garbage")
+    assert executor.evaluate_cached("print(1);") == "print(1);"
+    assert core.compiled == 2
+    with open(path, "rb") as f:
+        assert f.read() == b"ok:print(1);"
+
+@_with_cache
+def test_cache_evicts_least_recently_used(core, cache_dir):
+    with mock.patch.object(executor, "CACHE_MAX_ENTRIES", 2):
+        executor.evaluate_cached("print(1);")
+        executor.evaluate_cached("print(2);")
+        first, second = (os.path.join(cache_dir, name) for name in _entries(cache_dir))
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        executor.evaluate_cached("print(3);")
+        remaining = [os.path.join(cache_dir, name) for name in _entries(cache_dir)]
+    assert len(remaining) == 2
+    assert first not in remaining and second in remaining
+
+def test_bracket_depth():
+    cases = [
+        ('while x < 3 {', 1),
+        ('}', -1),
+        ('let a = [1, 2];', 0),
+        ('print(a[', 2),
+        ('output "}";', 0),
+        ('print("(");', 0),
+        ('// }', 0),
+        ('if x { // }', 1),
+    ]
+    for line, expected in cases:
+        assert executor._bracket_depth(line) == expected, line
+
+if __name__ == "__main__":
+    test_cache_miss_compiles_and_stores()
+    test_cache_hit_skips_compilation()
+    test_corrupt_cache_entry_is_replaced()
+    test_cache_evicts_least_recently_used()
+    test_bracket_depth()
@@ -14,15 +14,32 @@ except ImportError as e:
 def test_run_code():
     source = 'print("Hello from Rust Core!"); let x = 10 + 20; print(x);'
     print(f"\nRunning source code:\n{source}")
+    output = core.run_code_b(source)
+    assert isinstance(output, bytes), type(output)
+    print(f"\nOutput:\n{output.decode()}")
+    assert b"Hello from Rust Core!" in output and b"30" in output, output
+    print("✅ Test Passed")
+
+def test_run_code_bytes():
+    output = core.run_code_bytes('print("héllo");'.encode("utf-8"))
+    assert output == "héllo\n", output
     try:
-        output = core.run_code(source)
-        print(f"\nOutput:\n{output}")
-        if "Hello from Rust Core!" in output and "30" in output:
-            print("✅ Test Passed")
-        else:
-            print("❌ Test Failed: valid output not found")
-    except Exception as e:
-        print(f"❌ Execution failed: {e}")
+        core.run_code_bytes(b'print("\xff");')
+    except RuntimeError as e:
+        assert "not valid UTF-8" in str(e), e
+    else:
+        raise AssertionError("invalid UTF-8 source was accepted")
+    print("✅ Test Passed")
+
+def test_compiled_program():
+    source = 'let xs = [10, 20]; print(xs[0] + xs[1]);'
+    print(f"\nCompiling once and running repeatedly:\n{source}")
+    program = core.compile(source)
+    outputs = [program.run() for _ in range(3)]
+    assert all(output == "30\n" for output in outputs), outputs
+    print("✅ Test Passed")
 
 if __name__ == "__main__":
     test_run_code()
+    test_run_code_bytes()
+    test_compiled_program()